@@ -1,16 +1,26 @@
 """Tests for tile pyramid generation."""
+import ctypes
+import gc
+import itertools
 import re
+import tarfile
+import warnings
+import weakref
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
 
 import numpy as np
 import pytest
+import tifffile
 from PIL import Image
 from skimage import data
 from skimage.metrics import peak_signal_noise_ratio
 
 from tiatoolbox.tools import pyramid
 from tiatoolbox.utils.image import imresize
-from tiatoolbox.wsicore import wsireader
+from tiatoolbox.wsicore import wsimeta, wsireader
 
 
 def test_zoomify_tile_path():
@@ -19,11 +29,12 @@ def test_zoomify_tile_path():
     wsi = wsireader.VirtualWSIReader(array)
     dz = pyramid.ZoomifyGenerator(wsi)
     path = dz.tile_path(0, 0, 0)
-    assert isinstance(path, Path)
-    assert len(path.parts) == 2
-    assert "TileGroup" in path.parts[0]
-    assert re.match(pattern=r"TileGroup\d+", string=path.parts[0]) is not None
-    assert re.match(pattern=r"\d+-\d+-\d+\.jpg", string=path.parts[1]) is not None
+    assert isinstance(path, str)
+    parts = path.split("/")
+    assert len(parts) == 2
+    assert "TileGroup" in parts[0]
+    assert re.match(pattern=r"TileGroup\d+", string=parts[0]) is not None
+    assert re.match(pattern=r"\d+-\d+-\d+\.jpg", string=parts[1]) is not None
 
 
 def test_zoomify_len():
@@ -34,6 +45,18 @@ def test_zoomify_len():
     assert len(dz) == (4 * 4) + (2 * 2) + 1
 
 
+def test_len_matches_tile_grid_size():
+    """Test __len__ matches the sum of the tile grid sizes for all levels."""
+    for shape in [(1024, 1024), (1000, 300), (257, 513), (1, 1)]:
+        wsi = wsireader.VirtualWSIReader(np.ones(shape))
+        for tile_size in [64, 100, 256]:
+            dz = pyramid.ZoomifyGenerator(wsi, tile_size=tile_size)
+            expected = sum(
+                np.prod(dz.tile_grid_size(level)) for level in range(dz.level_count)
+            )
+            assert len(dz) == expected
+
+
 def test_zoomify_iter():
     """Test __iter__ for ZoomifyGenerator."""
     array = np.ones((1024, 1024))
@@ -44,6 +67,96 @@ def test_zoomify_iter():
         assert tile.size == (256, 256)
 
 
+def test_morton_order():
+    """Test Morton (Z-order) traversal of a tile grid."""
+    order = list(pyramid.TilePyramidGenerator._morton_order(2, 2))
+    assert order == [(0, 0), (1, 0), (0, 1), (1, 1)]
+
+    order = list(pyramid.TilePyramidGenerator._morton_order(4, 2))
+    assert order == [(0, 0), (1, 0), (0, 1), (1, 1), (2, 0), (3, 0), (2, 1), (3, 1)]
+
+    for width, height in [(0, 3), (1, 1), (5, 3), (3, 5), (1, 7), (16, 16)]:
+        order = list(pyramid.TilePyramidGenerator._morton_order(width, height))
+        assert len(order) == width * height
+        assert set(order) == set(np.ndindex(width, height))
+
+    # Elongated grids are split into square blocks
+    order = list(pyramid.TilePyramidGenerator._morton_order(2000, 8))
+    assert len(order) == 2000 * 8
+    assert order[64] == (8, 0)
+
+
+def test_encode_jpeg():
+    """Test JPEG encoding of RGB and greyscale tiles."""
+    grey = data.camera()[:64, :96]
+    rgb = np.dstack([grey] * 3)
+    for image in [rgb, grey]:
+        decoded = Image.open(BytesIO(pyramid._encode_jpeg(image)))
+        assert decoded.format == "JPEG"
+        assert decoded.size == (96, 64)
+        assert np.array(decoded).shape == image.shape
+
+
+def test_level_dimensions_and_tile_grid_size():
+    """Test level dimensions and tile grid sizes are rounded up."""
+    array = np.ones((1000, 300))
+    wsi = wsireader.VirtualWSIReader(array)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64)
+    assert dz.level_count == 5
+    assert dz.level_dimensions(4) == (300, 1000)
+    assert dz.level_dimensions(3) == (150, 500)
+    assert dz.level_dimensions(1) == (38, 125)
+    assert dz.tile_grid_size(4) == (5, 16)
+    assert dz.tile_grid_size(1) == (1, 2)
+    assert all(isinstance(n, int) for n in dz.tile_grid_size(4))
+
+
+def test_level_downsample():
+    """Test level downsamples and invalid levels."""
+    array = np.ones((1000, 300))
+    wsi = wsireader.VirtualWSIReader(array)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64)
+    assert [dz.level_downsample(n) for n in range(dz.level_count)] == [16, 8, 4, 2, 1]
+    for level in [-1, dz.level_count]:
+        with pytest.raises(IndexError):
+            dz.level_downsample(level)
+
+
+def test_level_read_matches_tile_read(tmp_path):
+    """Test tiles sliced from a whole level read match per-tile reads."""
+    array = data.astronaut()[:500, :450]
+    path = tmp_path / "slide.tiff"
+    tifffile.imwrite(path, array, tile=(64, 64), photometric="rgb")
+    readers = [
+        wsireader.VirtualWSIReader(array),
+        wsireader.OpenSlideWSIReader(path),
+    ]
+    for wsi, overlap in itertools.product(readers, [0, 3]):
+        level_reads = pyramid.ZoomifyGenerator(wsi, tile_size=64, overlap=overlap)
+        tile_reads = pyramid.ZoomifyGenerator(
+            wsi, tile_size=64, overlap=overlap, level_read_threshold_bytes=0
+        )
+        assert level_reads._read_level(3) is not None
+        assert tile_reads._read_level(3) is None
+        for level_tile, tile in zip(level_reads, tile_reads):
+            assert level_tile.size == tile.size
+            level_tile = np.array(level_tile).astype(float)
+            assert np.abs(level_tile - np.array(tile)).max() <= 1
+
+
+def test_generator_garbage_collected():
+    """Test cached methods do not keep a generator alive after deletion."""
+    array = np.ones((1024, 1024))
+    wsi = wsireader.VirtualWSIReader(array)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=256)
+    dz.tile_path(2, 1, 1)
+    dz.level_dimensions(1)
+    reference = weakref.ref(dz)
+    del dz
+    gc.collect()
+    assert reference() is None
+
+
 def test_tile_grid_size_invalid_level():
     """Test tile_grid_size for IndexError on invalid levels."""
     array = np.ones((1024, 1024))
@@ -83,6 +196,60 @@ def test_get_tile_large_xy():
         dz.get_tile(0, 100, 100)
 
 
+def test_get_tile_cache():
+    """Test repeated tile requests are served from the tile cache."""
+    array = data.astronaut()
+    wsi = wsireader.VirtualWSIReader(array)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64)
+    tile = dz.get_tile(3, 1, 2)
+    assert dz.cache_hit_rate == 0
+    cached_tile = dz.get_tile(3, 1, 2)
+    assert dz.cache_hit_rate == 0.5
+    assert np.array_equal(np.array(tile), np.array(cached_tile))
+
+    # Modifying a returned tile must not modify the cached tile
+    cached_tile.paste((255, 0, 0), (0, 0, 64, 64))
+    assert np.array_equal(np.array(tile), np.array(dz.get_tile(3, 1, 2)))
+
+    dz.clear_cache()
+    assert dz.cache_hit_rate == 0
+    dz.get_tile(3, 1, 2)
+    assert dz.cache_hit_rate == 0
+
+
+def test_get_tile_cache_eviction():
+    """Test the tile cache evicts the least recently used tile."""
+    array = data.astronaut()
+    wsi = wsireader.VirtualWSIReader(array)
+    tile_bytes = 64 * 64 * 3
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64, cache_bytes=2 * tile_bytes)
+    dz.get_tile(3, 0, 0)
+    dz.get_tile(3, 1, 0)
+    dz.get_tile(3, 0, 0)  # hit, (3, 1, 0) is now least recently used
+    dz.get_tile(3, 2, 0)  # evicts (3, 1, 0)
+    assert dz._cache_bytes_used == 2 * tile_bytes
+    dz.get_tile(3, 0, 0)  # hit
+    dz.get_tile(3, 1, 0)  # miss
+    assert dz.cache_hit_rate == 2 / 6
+
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64, cache_bytes=0)
+    dz.get_tile(3, 0, 0)
+    dz.get_tile(3, 0, 0)
+    assert dz.cache_hit_rate == 0
+    assert dz._cache_bytes_used == 0
+
+
+def test_dump_and_iter_bypass_cache(tmp_path):
+    """Test dumping and iterating do not fill the tile cache."""
+    array = data.astronaut()
+    wsi = wsireader.VirtualWSIReader(array)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64, level_read_threshold_bytes=0)
+    dz.dump(tmp_path / "pyramid.zip", container="zip")
+    assert len(list(dz)) == len(dz)
+    assert not dz._cache
+    assert dz._cache_bytes_used == 0
+
+
 def test_zoomify_tile_group_index_error():
     """Test IndexError for Zoomify tile groups."""
     array = np.ones((1024, 1024))
@@ -92,6 +259,23 @@ def test_zoomify_tile_group_index_error():
         dz.tile_group(0, 100, 100)
 
 
+def test_zoomify_tile_group():
+    """Test Zoomify tile groups increment every 256 tiles in ZYX order."""
+    array = np.ones((4096, 2048))
+    wsi = wsireader.VirtualWSIReader(array)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64)
+    tile_index = 0
+    for level in range(dz.level_count):
+        width, height = dz.tile_grid_size(level)
+        for y in range(height):
+            for x in range(width):
+                assert dz.tile_group(level, x, y) == tile_index // 256
+                tile_index += 1
+    assert tile_index == len(dz)
+    with pytest.raises(IndexError):
+        dz.tile_group(0, -1, 0)
+
+
 def test_zoomify_dump_options_combinations(tmp_path):  # noqa: CCR001
     """Test for no fatal errors on all option combinations for dump."""
     array = data.camera()
@@ -114,6 +298,36 @@ def test_zoomify_dump_options_combinations(tmp_path):  # noqa: CCR001
             assert out_path.exists()
 
 
+def test_zoomify_dump_zstd(tmp_path):
+    """Test dumping to archives with zstd compression."""
+    array = data.camera()
+    wsi = wsireader.VirtualWSIReader(array)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64)
+
+    tar_path = tmp_path / "pyramid.tar.zst"
+    if hasattr(tarfile.TarFile, "zstopen") or pyramid.zstandard is not None:
+        dz.dump(tar_path, container="tar", compression="zstd")
+        with tar_path.open("rb") as fh:
+            assert fh.read(4) == b"\x28\xb5\x2f\xfd"  # zstd frame magic number
+        if pyramid.zstandard is not None:
+            with tar_path.open("rb") as fh:
+                reader = pyramid.zstandard.ZstdDecompressor().stream_reader(fh)
+                with tarfile.open(fileobj=reader, mode="r|") as archive:
+                    assert len(archive.getmembers()) == len(dz)
+    else:
+        with pytest.raises(ValueError, match="Unsupported compression for tar"):
+            dz.dump(tar_path, container="tar", compression="zstd")
+
+    zip_path = tmp_path / "pyramid.zip"
+    if hasattr(zipfile, "ZIP_ZSTANDARD"):
+        dz.dump(zip_path, container="zip", compression="zstd")
+        with zipfile.ZipFile(zip_path) as archive:
+            assert len(archive.namelist()) == len(dz)
+    else:
+        with pytest.raises(ValueError, match="Unsupported compression for zip"):
+            dz.dump(zip_path, container="zip", compression="zstd")
+
+
 def test_zoomify_dump_compression_error(tmp_path):
     """Test ValueError is raised on invalid compression modes."""
     array = data.camera()
@@ -154,6 +368,45 @@ def test_zoomify_dump(tmp_path):
     assert Image.open(out_path / "TileGroup0" / "0-0-0.jpg").size == (64, 64)
 
 
+def test_zoomify_dump_archive_contents(tmp_path):
+    """Test that every tile is written to an archive and can be decoded."""
+    array = data.camera()
+    wsi = wsireader.VirtualWSIReader(array)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64)
+
+    zip_path = tmp_path / "pyramid.zip"
+    dz.dump(zip_path, container="zip")
+    with zipfile.ZipFile(zip_path) as archive:
+        names = archive.namelist()
+        assert len(names) == len(dz)
+        assert len(set(names)) == len(names)
+        tile = Image.open(BytesIO(archive.read("TileGroup0/0-0-0.jpg")))
+        assert tile.size == (64, 64)
+
+    tar_path = tmp_path / "pyramid.tar"
+    dz.dump(tar_path, container="tar")
+    with tarfile.open(tar_path) as archive:
+        members = archive.getmembers()
+        assert len(members) == len(dz)
+        assert all(member.size > 0 for member in members)
+        tile = Image.open(archive.extractfile("TileGroup0/0-0-0.jpg"))
+        assert tile.size == (64, 64)
+
+
+def test_zoomify_dump_encode_workers(tmp_path):
+    """Test dumping with JPEG encoding in a pool of processes."""
+    array = data.astronaut()
+    wsi = wsireader.VirtualWSIReader(array)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64)
+    out_path = tmp_path / "pyramid.zip"
+    dz.dump(out_path, container="zip", num_encode_workers=2)
+    with zipfile.ZipFile(out_path) as archive:
+        assert len(archive.namelist()) == len(dz)
+        data_2_0_0 = archive.read("TileGroup0/2-0-0.jpg")
+    expected = pyramid._encode_jpeg(np.asarray(dz.get_tile(2, 0, 0)))
+    assert data_2_0_0 == expected
+
+
 def test_get_thumb_tile():
     """Test getting a thumbnail tile (whole WSI in one tile)."""
     array = data.camera()
@@ -166,6 +419,279 @@ def test_get_thumb_tile():
     assert np.isinf(psnr) or psnr < 40
 
 
+def test_get_thumb_tile_cached():
+    """Test the thumbnail tile is only read from the WSI once."""
+    array = data.camera()
+    wsi = wsireader.VirtualWSIReader(array)
+    read_rect = wsi.read_rect
+    calls = []
+
+    def counting_read_rect(*args, **kwargs):
+        calls.append(args)
+        return read_rect(*args, **kwargs)
+
+    wsi.read_rect = counting_read_rect
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=224, cache_bytes=0)
+    thumb = dz.get_thumb_tile()
+    thumb.thumbnail((10, 10))
+    assert dz.get_thumb_tile().size == (224, 224)
+    assert len(calls) == 1
+
+
+def test_interp_for_level():
+    """Test the interpolation for a level is resolved once per level."""
+
+    class MultiLevelReader(wsireader.WSIReader):
+        """A reader with three levels which records read parameters."""
+
+        def __init__(self):
+            super().__init__("slide.svs")
+            self.interpolations = []
+
+        def _info(self):
+            return wsimeta.WSIMeta(
+                slide_dimensions=(4096, 4096),
+                level_dimensions=[(4096, 4096), (1024, 1024), (256, 256)],
+                level_downsamples=[1, 4, 16],
+                level_count=3,
+                axes="YXS",
+            )
+
+        def read_rect(self, location, size, interpolation="optimise", **kwargs):
+            self.interpolations.append(interpolation)
+            return np.zeros((*size[::-1], 3), dtype=np.uint8)
+
+    wsi = MultiLevelReader()
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=256)
+    for level in range(dz.sub_tile_level_count, dz.level_count):
+        assert dz._interp_for_level(level) == "area"
+        dz.get_tile(level, 0, 0)
+        dz.get_tile(level, 0, 0, interpolation="linear")
+    assert set(wsi.interpolations) == {"area", "linear"}
+
+    virtual = pyramid.ZoomifyGenerator(wsireader.VirtualWSIReader(data.camera()))
+    assert virtual._interp_for_level(virtual.level_count - 1) == "optimise"
+
+
+def test_zoomify_iter_prefetch():
+    """Test iterating with prefetching gives tiles in order."""
+    array = data.camera()
+    wsi = wsireader.VirtualWSIReader(array)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64, level_read_threshold_bytes=0)
+    expected = [
+        dz.get_tile(level, x, y)
+        for level in range(dz.level_count)
+        for x, y in dz._morton_order(*dz.tile_grid_size(level))
+    ]
+    tiles = list(dz)
+    assert len(tiles) == len(expected) == len(dz)
+    for tile, expected_tile in zip(tiles, expected):
+        assert np.array_equal(np.asarray(tile), np.asarray(expected_tile))
+
+    # Stopping early cancels the remaining reads
+    iterator = iter(dz)
+    next(iterator)
+    iterator.close()
+
+
+def test_prefetch():
+    """Test prefetching submits a bounded number of calls ahead."""
+    submitted = []
+
+    def record(n):
+        return n
+
+    def items():
+        for n in range(10):
+            submitted.append(n)
+            yield (n,)
+
+    with ThreadPoolExecutor(2) as executor:
+        results = pyramid._prefetch(executor, record, items(), ahead=3)
+        assert next(results) == 0
+        assert len(submitted) == 4
+        assert list(results) == list(range(1, 10))
+
+
+def test_reader_pool():
+    """Test readers are opened lazily up to the pool size and reused."""
+    array = data.camera()
+    opened = []
+
+    def open_reader():
+        reader = wsireader.VirtualWSIReader(array)
+        opened.append(reader)
+        return reader
+
+    reader_pool = pyramid._ReaderPool(open_reader, max_size=2)
+    assert not opened
+    with reader_pool.reader() as first:
+        with reader_pool.reader() as second:
+            assert first is not second
+    with reader_pool.reader() as third:
+        assert third in (first, second)
+    assert len(opened) == 2
+    reader_pool.close()
+
+
+def test_reader_pool_open_error():
+    """Test a failure to open a reader is raised in waiting threads."""
+
+    def open_reader():
+        raise OSError("Cannot open slide")
+
+    reader_pool = pyramid._ReaderPool(open_reader, max_size=1)
+    for _ in range(2):
+        with pytest.raises(OSError, match="Cannot open slide"):
+            with reader_pool.reader():
+                pass
+    reader_pool.close()
+
+
+def test_make_reader_pool(tmp_path):
+    """Test pooled readers are reopened with the same reader and metadata."""
+    path = tmp_path / "slide.tiff"
+    tifffile.imwrite(path, data.astronaut(), tile=(64, 64), photometric="rgb")
+    wsi = wsireader.OpenSlideWSIReader(path, mpp=(0.5, 0.5))
+    info = wsi.info
+    info.objective_power = 40
+    wsi.info = info
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64, level_read_threshold_bytes=0)
+    reader_pool = dz._make_reader_pool()
+    with reader_pool.reader() as reader:
+        assert type(reader) is wsireader.OpenSlideWSIReader
+        assert reader is not wsi
+        assert reader.info.objective_power == 40
+        assert tuple(reader.info.mpp) == (0.5, 0.5)
+    reader_pool.close()
+    # Pooled readers are closed, the original reader is not
+    with pytest.raises(ctypes.ArgumentError):
+        reader.read_rect((0, 0), (8, 8))
+    assert wsi.read_rect((0, 0), (8, 8)).shape == (8, 8, 3)
+
+    tiles = list(dz)
+    assert len(tiles) == len(dz)
+    assert np.array_equal(np.asarray(tiles[-1]), np.asarray(dz.get_tile(3, 7, 7)))
+    dz.dump(tmp_path / "pyramid.zip", container="zip")
+    with zipfile.ZipFile(tmp_path / "pyramid.zip") as archive:
+        assert len(archive.namelist()) == len(dz)
+
+
+def test_make_reader_pool_tiff(tmp_path):
+    """Test pooled TIFF readers keep the series and share the cache size."""
+    path = tmp_path / "slide.svs"
+    tifffile.imwrite(
+        path,
+        data.astronaut()[:500, :450],
+        tile=(64, 64),
+        photometric="rgb",
+        description=(
+            "Aperio Image Library v10.0.0\n"
+            "450x500 [0,0 450x500] (64x64) RAW|AppMag = 20|MPP = 0.5"
+        ),
+    )
+    wsi = wsireader.TIFFWSIReader(path, cache_size=2**20)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64, level_read_threshold_bytes=0)
+    reader_pool = dz._make_reader_pool()
+    with reader_pool.reader() as reader:
+        assert type(reader) is wsireader.TIFFWSIReader
+        assert reader is not wsi
+        assert reader.series_n == wsi.series_n
+        assert reader.cache_size == 2**20 // reader_pool.max_size
+    reader_pool.close()
+    assert reader.tiff.filehandle.closed
+    assert not wsi.tiff.filehandle.closed
+
+    dz.dump(tmp_path / "pyramid.zip", container="zip")
+    with zipfile.ZipFile(tmp_path / "pyramid.zip") as archive:
+        assert len(archive.namelist()) == len(dz)
+
+
+def test_make_reader_pool_custom_reader(tmp_path):
+    """Test custom readers are shared rather than reopened."""
+
+    class ArrayReader(wsireader.WSIReader):
+        """A file-backed reader which is not one of the built-in readers."""
+
+        def __init__(self):
+            super().__init__("slide.svs")
+            self.reader = wsireader.VirtualWSIReader(data.astronaut())
+
+        def _info(self):
+            return self.reader.info
+
+        def read_rect(self, *args, **kwargs):
+            return self.reader.read_rect(*args, **kwargs)
+
+    dz = pyramid.ZoomifyGenerator(
+        ArrayReader(), tile_size=64, level_read_threshold_bytes=0
+    )
+    assert dz._make_reader_pool() is None
+    assert len(list(dz)) == len(dz)
+    dz.dump(tmp_path / "pyramid.zip", container="zip")
+    with zipfile.ZipFile(tmp_path / "pyramid.zip") as archive:
+        assert len(archive.namelist()) == len(dz)
+
+
+def test_reader_pool_fallback(tmp_path, monkeypatch):
+    """Test iterating and dumping fall back to the original reader."""
+    path = tmp_path / "slide.tiff"
+    tifffile.imwrite(path, data.astronaut(), tile=(64, 64), photometric="rgb")
+    wsi = wsireader.OpenSlideWSIReader(path)
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64, level_read_threshold_bytes=0)
+
+    def fail_to_open(*args, **kwargs):
+        raise OSError("Too many open files")
+
+    monkeypatch.setattr(wsireader.OpenSlideWSIReader, "__init__", fail_to_open)
+    with pytest.warns(UserWarning, match="Unable to open a pooled reader"):
+        assert len(list(dz)) == len(dz)
+    with pytest.warns(UserWarning, match="Unable to open a pooled reader"):
+        dz.dump(tmp_path / "pyramid.zip", container="zip")
+    with zipfile.ZipFile(tmp_path / "pyramid.zip") as archive:
+        assert len(archive.namelist()) == len(dz)
+
+
+def test_zoomify_dump_reader_pool(tmp_path):
+    """Test dumping with a pool of readers gives the same tiles."""
+    array = data.camera()
+    wsi = wsireader.VirtualWSIReader(array)
+    dz = pyramid.ZoomifyGenerator(
+        wsi, tile_size=64, cache_bytes=0, level_read_threshold_bytes=0
+    )
+    assert dz._make_reader_pool() is None
+    opened = []
+
+    def open_reader():
+        reader = wsireader.VirtualWSIReader(array)
+        opened.append(reader)
+        return reader
+
+    dz._make_reader_pool = lambda: pyramid._ReaderPool(open_reader, max_size=2)
+    dz.dump(tmp_path / "pooled", container="zip")
+    assert 1 <= len(opened) <= 2
+    assert dz._reader_pool is None
+
+    reference = pyramid.ZoomifyGenerator(wsi, tile_size=64)
+    reference.dump(tmp_path / "reference", container="zip")
+    with zipfile.ZipFile(tmp_path / "pooled") as pooled, zipfile.ZipFile(
+        tmp_path / "reference"
+    ) as expected:
+        assert sorted(pooled.namelist()) == sorted(expected.namelist())
+
+
+def test_scale_warning_only_hidden_for_thumb_tile():
+    """Test upsampling warnings are only hidden for the thumbnail read."""
+    wsi = wsireader.VirtualWSIReader(np.ones((32, 32, 3), dtype=np.uint8))
+    dz = pyramid.ZoomifyGenerator(wsi, tile_size=64)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        dz.get_thumb_tile()
+    assert not [w for w in caught if "Scale > 1" in str(w.message)]
+    with pytest.warns(UserWarning, match="Read: Scale > 1"):
+        wsi.read_rect((0, 0), (64, 64), resolution=2, units="baseline")
+
+
 def test_sub_tile_levels():
     """Test sub-tile level generation."""
     array = data.camera()
@@ -29,24 +29,317 @@ be easily serialised via the use of an io.BytesIO object or saved
 directly to disk.
 """
 
+import itertools
+import os
+import queue
 import tarfile
+import threading
 import time
 import warnings
 import zipfile
-from functools import lru_cache
+from collections import OrderedDict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import ExitStack, contextmanager, nullcontext
 from io import BytesIO
 from pathlib import Path
-from typing import Iterable, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import defusedxml
 import numpy as np
 from PIL import Image
 
-from tiatoolbox.utils.transforms import imresize
-from tiatoolbox.wsicore.wsireader import WSIReader
+from tiatoolbox.wsicore.wsireader import (
+    OmnyxJP2WSIReader,
+    OpenSlideWSIReader,
+    TIFFWSIReader,
+    VirtualWSIReader,
+    WSIReader,
+)
+
+try:
+    from turbojpeg import TJPF_GRAY, TJPF_RGB, TJSAMP_420, TJSAMP_GRAY, TurboJPEG
+except ImportError:  # pragma: no cover
+    TurboJPEG = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
 
 defusedxml.defuse_stdlib()
 
+_turbo_jpeg = None
+_turbo_jpeg_lock = threading.Lock()
+
+
+def _get_turbo_jpeg() -> Optional["TurboJPEG"]:
+    """Return a shared TurboJPEG instance if libjpeg-turbo is available.
+
+    The instance is created lazily on first use. None is returned if
+    PyTurboJPEG is not installed or the libjpeg-turbo shared library
+    cannot be loaded.
+
+    """
+    global _turbo_jpeg
+    if TurboJPEG is None:
+        return None
+    with _turbo_jpeg_lock:
+        if _turbo_jpeg is None:
+            try:
+                _turbo_jpeg = TurboJPEG()
+            except (OSError, RuntimeError):
+                _turbo_jpeg = False
+    return _turbo_jpeg or None
+
+
+def _encode_jpeg(image: np.ndarray, quality: int = 75) -> bytes:
+    """Encode an RGB or greyscale image as JPEG.
+
+    Uses libjpeg-turbo via PyTurboJPEG when it is available, which
+    encodes directly from the array buffer. Otherwise falls back to
+    Pillow. Chroma subsampling is 4:2:0 in both cases.
+
+    Args:
+        image (:class:`numpy.ndarray`): The image to encode. Either
+            HxW (greyscale) or HxWx3 (RGB) of type uint8.
+        quality (int): JPEG quality from 1 to 100. Defaults to 75.
+
+    Returns:
+        bytes: The JPEG encoded image.
+
+    """
+    turbo_jpeg = _get_turbo_jpeg()
+    is_rgb = image.ndim == 3 and image.shape[2] == 3
+    is_grey = image.ndim == 2
+    if turbo_jpeg is not None and image.dtype == np.uint8 and (is_rgb or is_grey):
+        if is_grey:
+            return turbo_jpeg.encode(
+                np.ascontiguousarray(image[..., np.newaxis]),
+                quality=quality,
+                pixel_format=TJPF_GRAY,
+                jpeg_subsample=TJSAMP_GRAY,
+            )
+        return turbo_jpeg.encode(
+            np.ascontiguousarray(image),
+            quality=quality,
+            pixel_format=TJPF_RGB,
+            jpeg_subsample=TJSAMP_420,
+        )
+    bio = BytesIO()
+    Image.fromarray(image).save(bio, format="jpeg", quality=quality)
+    return bio.getvalue()
+
+
+def _bounded_imap_unordered(
+    executor: Executor, func: Callable, items: Iterable[tuple], max_pending: int
+) -> Iterator[Any]:
+    """Apply a function to each item using an executor.
+
+    Unlike :func:`Executor.map`, items are only submitted while there
+    are fewer than `max_pending` unfinished calls, so memory use does
+    not grow with the number of items. Results are yielded in the order
+    that they complete.
+
+    Args:
+        executor (Executor): The executor to submit calls to.
+        func (callable): The function to call.
+        items (iterable): Tuples of positional arguments for `func`.
+        max_pending (int): Maximum number of unfinished calls.
+
+    Yields:
+        The result of each call to `func`.
+
+    """
+    pending = set()
+    for item in items:
+        pending.add(executor.submit(func, *item))
+        if len(pending) < max_pending:
+            continue
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+    for future in as_completed(pending):
+        yield future.result()
+
+
+def _prefetch(
+    executor: Executor, func: Callable, items: Iterable[tuple], ahead: int = 4
+) -> Iterator[Any]:
+    """Apply a function to each item using an executor, in order.
+
+    Calls for up to `ahead` items after the current one are submitted
+    before its result is yielded, so that they run while the caller is
+    busy with the current result. Results are yielded in item order.
+
+    Args:
+        executor (Executor): The executor to submit calls to.
+        func (callable): The function to call.
+        items (iterable): Tuples of positional arguments for `func`.
+        ahead (int): Number of items to submit ahead of the current
+            one. Defaults to 4.
+
+    Yields:
+        The result of each call to `func`.
+
+    """
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, *item))
+            if len(pending) > ahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Don't run calls for results which will never be used
+        for future in pending:
+            future.cancel()
+
+
+def _compact_bits(n: int) -> int:
+    """Gather the even bits of an integer into the lowest bits.
+
+    This is the inverse of interleaving bits with zeros and is used to
+    decode one coordinate of a Morton (Z-order) index.
+
+    """
+    n &= 0x5555555555555555
+    n = (n | (n >> 1)) & 0x3333333333333333
+    n = (n | (n >> 2)) & 0x0F0F0F0F0F0F0F0F
+    n = (n | (n >> 4)) & 0x00FF00FF00FF00FF
+    n = (n | (n >> 8)) & 0x0000FFFF0000FFFF
+    return (n | (n >> 16)) & 0x00000000FFFFFFFF
+
+
+def _available_cpu_count() -> int:
+    """Return the number of CPUs this process is allowed to run on.
+
+    This respects CPU affinity (e.g. taskset or container limits) where
+    the platform supports it, unlike :func:`os.cpu_count`.
+
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover
+        return os.cpu_count() or 1
+
+
+class _ReaderPool:
+    """A pool of WSIReaders to share between tile reading threads.
+
+    Opening a reader can be slow (e.g. parsing slide metadata), and
+    many threads opening readers at once can stall each other. Readers
+    are therefore opened lazily, one at a time, on a single background
+    thread and returned to the pool after each read. Threads block
+    waiting for a reader once `max_size` readers have been opened.
+
+    Args:
+        open_reader (callable): Function which opens a new reader.
+        max_size (int): The maximum number of readers to open.
+        fallback (WSIReader): A reader to share between threads if a
+            new reader cannot be opened. If None, the error from
+            opening a reader is raised instead. Defaults to None.
+        close_reader (callable): Function which closes a reader opened
+            by `open_reader`. Called for each of them by :func:`close`.
+            Defaults to None (readers are not explicitly closed).
+
+    """
+
+    def __init__(
+        self,
+        open_reader: Callable[[], WSIReader],
+        max_size: int,
+        fallback: Optional[WSIReader] = None,
+        close_reader: Optional[Callable[[WSIReader], None]] = None,
+    ):
+        self.open_reader = open_reader
+        self.max_size = max_size
+        self.fallback = fallback
+        self.close_reader = close_reader
+        self._opened = []
+        self._readers = queue.Queue()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._opener = ThreadPoolExecutor(max_workers=1)
+
+    def _open_reader(self) -> None:
+        """Open a reader and add it to the pool."""
+        try:
+            reader = self.open_reader()
+            self._opened.append(reader)
+        except Exception as error:  # noqa: B902
+            if self.fallback is None:
+                # Poison the pool so that waiting threads raise, not hang
+                reader = error
+            else:
+                warnings.warn(
+                    f"Unable to open a pooled reader ({error}). "
+                    "Sharing the original reader between threads instead."
+                )
+                reader = self.fallback
+                # Don't keep trying to open readers which will also fail
+                with self._lock:
+                    self._size = self.max_size
+        self._readers.put(reader)
+
+    @contextmanager
+    def reader(self) -> Iterator[WSIReader]:
+        """Borrow a reader from the pool for the duration of the context."""
+        try:
+            reader = self._readers.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._size < self.max_size:
+                    self._size += 1
+                    self._opener.submit(self._open_reader)
+            reader = self._readers.get()
+        if isinstance(reader, Exception):
+            self._readers.put(reader)
+            raise reader
+        try:
+            yield reader
+        finally:
+            self._readers.put(reader)
+
+    def close(self) -> None:
+        """Stop the background thread and close the pooled readers.
+
+        Only readers opened by the pool are closed, not the fallback.
+
+        """
+        self._opener.shutdown(wait=True)
+        while not self._readers.empty():
+            self._readers.get_nowait()
+        if self.close_reader is not None:
+            for reader in self._opened:
+                self.close_reader(reader)
+        self._opened.clear()
+
+
+def _close_reader(reader: WSIReader) -> None:
+    """Close the open file handles of a file based reader."""
+    if isinstance(reader, TIFFWSIReader):
+        reader._zarr_store.close()
+        reader.tiff.close()
+    elif isinstance(reader, OpenSlideWSIReader):
+        reader.openslide_wsi.close()
+
 
 class TilePyramidGenerator:
     r"""Generic tile pyramid generator with sensible defaults.
@@ -61,6 +354,14 @@ class TilePyramidGenerator:
             Default is 2.
         tile_overlap (int): The number of extra pixel to add to each
             edge of the tile. Default is 0.
+        cache_bytes (int): The maximum number of bytes of tile pixel
+            data to keep in an in-memory least recently used cache of
+            tiles returned by `get_tile`. Default is 64 MiB. Setting
+            to 0 disables the cache.
+        level_read_threshold_bytes (int): Levels with fewer RGB bytes
+            than this are read from the WSI in one go when iterating
+            or dumping tiles, instead of once per tile. Default is
+            256 MiB. Setting to 0 always reads per tile.
 
     """
 
@@ -70,11 +371,40 @@ class TilePyramidGenerator:
         tile_size: int = 256,
         downsample: int = 2,
         overlap: int = 0,
+        cache_bytes: int = 64 * 1024 * 1024,
+        level_read_threshold_bytes: int = 256 * 1024 * 1024,
     ):
         self.wsi = wsi
         self.tile_size = tile_size
         self.overlap = overlap
         self.downsample = downsample
+        self.cache_bytes = cache_bytes
+        self.level_read_threshold_bytes = level_read_threshold_bytes
+        self._cache = OrderedDict()
+        self._cache_bytes_used = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_lock = threading.Lock()
+        # Reading WSIReader.info copies the metadata, so read it once here
+        info = self.wsi.info
+        self._slide_dimensions = np.asarray(info.slide_dimensions, dtype=np.int64)
+        self._wsi_level_downsamples = [float(x) for x in info.level_downsamples]
+        self._m_level_count = None
+        # Plain dictionaries are used rather than functools.lru_cache, which
+        # would keep a reference to self and needs a lock on every call.
+        self._level_dimensions_cache = {}
+        self._tile_grid_size_cache = {}
+        self._interp_cache = {}
+        self._m_thumb_tile = None
+        self._thumb_tile_lock = threading.Lock()
+        self._m_level_tile_counts = None
+        self._m_tile_count_prefix = None
+        # Set while dumping so that threads do not share a single reader
+        self._reader_pool = None
+        # Downsamples are looked up for every tile, so compute them all here
+        self._level_downsamples = [
+            2 ** (self.level_count - level - 1) for level in range(self.level_count)
+        ]
 
     @property
     def output_tile_size(self) -> int:
@@ -85,12 +415,12 @@ class TilePyramidGenerator:
         """
         return self.tile_size + 2 * self.overlap
 
-    @lru_cache(maxsize=None)
     def level_downsample(self, level: int) -> float:
         """Find the downsample factor for a level."""
-        return 2 ** (self.level_count - level - 1)
+        if level < 0:
+            raise IndexError("Invalid level")
+        return self._level_downsamples[level]
 
-    @lru_cache(maxsize=None)
     def level_dimensions(self, level: int) -> Tuple[int, int]:
         """The total pixel dimensions of the tile pyramid at a given level.
 
@@ -98,13 +428,15 @@ class TilePyramidGenerator:
             level (int): The level to calculate the dimensions for.
 
         """
-        baseline_dims = self.wsi.info.slide_dimensions
-        level_dims = np.ceil(
-            np.divide(baseline_dims, self.level_downsample(level))
-        ).astype(int)
-        return tuple(level_dims)
+        dimensions = self._level_dimensions_cache.get(level)
+        if dimensions is None:
+            width, height = self._slide_dimensions.tolist()
+            downsample = self.level_downsample(level)
+            # Integer ceil division, plain Python is faster than NumPy here
+            dimensions = int(-(-width // downsample)), int(-(-height // downsample))
+            self._level_dimensions_cache[level] = dimensions
+        return dimensions
 
-    @lru_cache(maxsize=None)
     def tile_grid_size(self, level: int) -> Tuple[int, int]:
         """Width and height of the minimal grid of tiles to cover the slide.
 
@@ -112,11 +444,14 @@ class TilePyramidGenerator:
             level (int): The level to calculate the grid size for.
 
         """
-        if level < 0 or level >= self.level_count:
-            raise IndexError("Invalid level")
-        return tuple(
-            np.ceil(np.divide(self.level_dimensions(level), self.tile_size)).astype(int)
-        )
+        grid_size = self._tile_grid_size_cache.get(level)
+        if grid_size is None:
+            if level < 0 or level >= self.level_count:
+                raise IndexError("Invalid level")
+            width, height = self.level_dimensions(level)
+            grid_size = -(-width // self.tile_size), -(-height // self.tile_size)
+            self._tile_grid_size_cache[level] = grid_size
+        return grid_size
 
     @property
     def sub_tile_level_count(self):
@@ -129,12 +464,53 @@ class TilePyramidGenerator:
         The number of levels is such that level_count - 1 is a 1:1 of
         the slide baseline resolution (level 0 of the WSI).
 
+        This property is cached and only calculated on the first call.
+
         """
-        wsi_to_tile_ratio = np.divide(self.wsi.info.slide_dimensions, self.tile_size)
+        if self._m_level_count is not None:
+            return self._m_level_count
+        wsi_to_tile_ratio = np.divide(self._slide_dimensions, self.tile_size)
         # Levels where a tile contains only part of the wsi
         super_level_count = np.ceil(np.log2(wsi_to_tile_ratio)).max()
         total_level_count = super_level_count + 1 + self.sub_tile_level_count
-        return int(total_level_count)
+        self._m_level_count = int(total_level_count)
+        return self._m_level_count
+
+    @staticmethod
+    def _morton_order(width: int, height: int) -> Iterator[Tuple[int, int]]:
+        """Generate the tile indexes of a grid in Morton (Z-order).
+
+        Neighbouring tiles are visited close together in time which
+        improves the hit rate of any tile cache in the underlying WSI
+        reader compared to raster order.
+
+        The grid is split along its longest side into square blocks with
+        a power of two side covering the shortest side, and each block
+        is visited in Morton order. This avoids stepping over the many
+        out of range indexes of a single square covering an elongated
+        grid.
+
+        Args:
+            width (int): The width of the grid.
+            height (int): The height of the grid.
+
+        Yields:
+            tuple: The (x, y) index of each tile in the grid.
+
+        """
+        side = 1 << int(max(min(width, height) - 1, 0)).bit_length()
+        block = [
+            (_compact_bits(index), _compact_bits(index >> 1))
+            for index in range(side * side)
+        ]
+        for offset in range(0, max(width, height), side):
+            for block_x, block_y in block:
+                if width >= height:
+                    x, y = block_x + offset, block_y
+                else:
+                    x, y = block_x, block_y + offset
+                if x < width and y < height:
+                    yield x, y
 
     def get_thumb_tile(self) -> Image:
         """Return a thumbnail which fits the whole slide in one tile.
@@ -142,15 +518,32 @@ class TilePyramidGenerator:
         The thumbnail output size has the longest edge equal to the
         tile size. The other edge preserves the orignal aspect ratio.
 
+        The thumbnail is read from the WSI once and cached. A copy of
+        the cached thumbnail is returned.
+
         """
-        slide_dims = np.array(self.wsi.info.slide_dimensions)
+        with self._thumb_tile_lock:
+            if self._m_thumb_tile is None:
+                self._m_thumb_tile = self._read_thumb_tile()
+        return self._m_thumb_tile.copy()
+
+    def _read_thumb_tile(self) -> Image:
+        """Read the thumbnail for :func:`get_thumb_tile` from the WSI."""
+        slide_dims = self._slide_dimensions
         tile_dim = self.tile_size + self.overlap
         out_dims = np.round(slide_dims / slide_dims.max() * tile_dim).astype(int)
-        bounds = (0, 0, *slide_dims)
-        thumb = self.wsi.read_bounds(
-            bounds, resolution=self.wsi.info.level_count - 1, units="level"
-        )
-        thumb = imresize(thumb, output_size=out_dims)
+        # Read directly at the output size so that the reader can pick
+        # the best level and resize once, rather than reading the lowest
+        # resolution level in full and resizing afterwards.
+        with warnings.catch_warnings(), self._borrow_reader() as wsi:
+            # Thumbnails of slides smaller than a tile are upsampled
+            warnings.filterwarnings("ignore", message="Read: Scale > 1")
+            thumb = wsi.read_rect(
+                (0, 0),
+                size=tuple(out_dims.tolist()),
+                resolution=tuple((out_dims / slide_dims).tolist()),
+                units="baseline",
+            )
         return Image.fromarray(thumb)
 
     def get_tile(
@@ -209,6 +602,26 @@ class TilePyramidGenerator:
         if level > self.level_count:
             raise IndexError("Invalid level")
 
+        if interpolation == "optimise":
+            interpolation = self._interp_for_level(level)
+        key = (level, x, y, pad_mode, interpolation)
+        rgb = self._cache_get(key)
+        if rgb is None:
+            rgb = self._read_tile(level, x, y, pad_mode, interpolation)
+            self._cache_put(key, rgb)
+        return Image.fromarray(rgb)
+
+    def _read_tile(
+        self, level: int, x: int, y: int, pad_mode: str, interpolation: str
+    ) -> np.ndarray:
+        """Read the pixel data for a tile from the WSI.
+
+        See :func:`get_tile` for a description of the arguments.
+
+        Returns:
+            :class:`numpy.ndarray`: The tile pixel data.
+
+        """
         scale = self.level_downsample(level)
         baseline_x = (x * self.tile_size * scale) - (self.overlap * scale)
         baseline_y = (y * self.tile_size * scale) - (self.overlap * scale)
@@ -218,18 +631,16 @@ class TilePyramidGenerator:
             output_size = self.output_tile_size // 2 ** (
                 self.sub_tile_level_count - level
             )
-            output_size = np.repeat(output_size, 2).astype(int)
+            output_size = (output_size, output_size)
             thumb = self.get_thumb_tile()
             thumb.thumbnail(output_size)
-            return thumb
-        slide_dimensions = np.array(self.wsi.info.slide_dimensions)
-        if all(slide_dimensions < [baseline_x, baseline_y]):
+            return np.asarray(thumb)
+        slide_width, slide_height = self._slide_dimensions.tolist()
+        if slide_width < baseline_x and slide_height < baseline_y:
             raise IndexError
 
-        # Don't print out any warnings about interpolation etc.
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            rgb = self.wsi.read_rect(
+        with self._borrow_reader() as wsi:
+            return wsi.read_rect(
                 coord,
                 size=output_size,
                 resolution=1 / scale,
@@ -237,9 +648,331 @@ class TilePyramidGenerator:
                 pad_mode=pad_mode,
                 interpolation=interpolation,
             )
-        return Image.fromarray(rgb)
 
-    def tile_path(self, level: int, x: int, y: int) -> Path:
+    def _interp_for_level(self, level: int) -> str:
+        """Find the interpolation which "optimise" would use for a level.
+
+        Every tile in a level is read at the same resolution, so the
+        reader would make the same choice for each tile. This mirrors
+        the read level selection of the reader: the WSI level with the
+        largest downsample not exceeding the pyramid level downsample
+        is read and then resized with area (downscaling) or cubic
+        (upscaling) interpolation. In-memory (virtual) WSIs may be
+        scaled relative to their baseline, so "optimise" is kept.
+
+        Args:
+            level (int): The pyramid level.
+
+        Returns:
+            str: The interpolation method to read the level with.
+
+        """
+        interpolation = self._interp_cache.get(level)
+        if interpolation is None:
+            if isinstance(self.wsi, VirtualWSIReader):
+                interpolation = "optimise"
+            else:
+                scale = self.level_downsample(level)
+                post_read_scales = [d / scale for d in self._wsi_level_downsamples]
+                sufficient = [s for s in post_read_scales if round(s, 3) <= 1]
+                post_read_scale = sufficient[-1] if sufficient else post_read_scales[0]
+                interpolation = "cubic" if post_read_scale > 1 else "area"
+            self._interp_cache[level] = interpolation
+        return interpolation
+
+    def _borrow_reader(self) -> ContextManager[WSIReader]:
+        """Borrow a reader from the reader pool if there is one.
+
+        Returns:
+            A context manager giving a reader from the pool while
+            dumping, otherwise giving :attr:`wsi`.
+
+        """
+        reader_pool = self._reader_pool
+        if reader_pool is None:
+            return nullcontext(self.wsi)
+        return reader_pool.reader()
+
+    @contextmanager
+    def _pooled_readers(self) -> Iterator[None]:
+        """Read tiles with a pool of readers for the duration of the context.
+
+        This does nothing if the WSI cannot be reopened or if a pool is
+        already in use. If a pooled reader fails to open, :attr:`wsi`
+        is used in its place, so the pool is never required to read.
+
+        """
+        reader_pool = None
+        if self._reader_pool is None:
+            reader_pool = self._make_reader_pool()
+        if reader_pool is None:
+            yield
+            return
+        self._reader_pool = reader_pool
+        try:
+            yield
+        finally:
+            self._reader_pool = None
+            reader_pool.close()
+
+    def _make_reader_pool(self) -> Optional[_ReaderPool]:
+        """Create a pool of readers for the WSI if it can be reopened.
+
+        Pooled readers are opened with the same reader class, constructor
+        arguments and metadata as :attr:`wsi`. Only the file based
+        readers in :mod:`tiatoolbox.wsicore.wsireader` are reopened.
+        None is returned for any other reader (e.g. in-memory or custom
+        subclasses), which is then shared between threads instead.
+
+        """
+        wsi = self.wsi
+        reader_type = type(wsi)
+        kwargs = {"mpp": wsi._manual_mpp, "power": wsi._manual_power}
+        max_size = min(10, _available_cpu_count())
+        if reader_type is TIFFWSIReader:
+            # Share the tile cache budget of the reader between the pool
+            cache_size = wsi.cache_size // max_size
+            kwargs.update(series=wsi.series_n, cache_size=cache_size)
+        elif reader_type not in (OpenSlideWSIReader, OmnyxJP2WSIReader):
+            return None
+        # Keep any metadata set on the reader, e.g. with the info setter
+        info = wsi.info
+
+        def open_reader() -> WSIReader:
+            reader = reader_type(wsi.input_path, **kwargs)
+            reader.info = info
+            return reader
+
+        # Fall back to sharing the reader if it cannot be reopened
+        return _ReaderPool(
+            open_reader, max_size, fallback=wsi, close_reader=_close_reader
+        )
+
+    def _read_uncached_tile(self, level: int, x: int, y: int) -> np.ndarray:
+        """Read a tile with the default options of :func:`get_tile`.
+
+        Iterating and dumping visit each tile once, so this bypasses the
+        tile cache rather than filling it with tiles which will not be
+        requested again.
+
+        """
+        return self._read_tile(level, x, y, "constant", self._interp_for_level(level))
+
+    def _cache_get(self, key: tuple) -> Optional[np.ndarray]:
+        """Get a tile from the cache and mark it as most recently used.
+
+        Args:
+            key (tuple): The cache key of the tile.
+
+        Returns:
+            :class:`numpy.ndarray`: The cached tile or None if the tile
+                is not in the cache.
+
+        """
+        with self._cache_lock:
+            rgb = self._cache.get(key)
+            if rgb is None:
+                self._cache_misses += 1
+                return None
+            self._cache_hits += 1
+            self._cache.move_to_end(key)
+            return rgb
+
+    def _cache_put(self, key: tuple, rgb: np.ndarray) -> None:
+        """Add a tile to the cache, evicting the least recently used tiles.
+
+        Tiles larger than the whole cache are not stored. The cached
+        array is made read-only so that it cannot be modified via an
+        image returned by :func:`get_tile`.
+
+        Args:
+            key (tuple): The cache key of the tile.
+            rgb (:class:`numpy.ndarray`): The tile pixel data.
+
+        """
+        if rgb.nbytes > self.cache_bytes:
+            return
+        rgb.setflags(write=False)
+        with self._cache_lock:
+            if key in self._cache:
+                return
+            self._cache[key] = rgb
+            self._cache_bytes_used += rgb.nbytes
+            while self._cache_bytes_used > self.cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes_used -= evicted.nbytes
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of calls to :func:`get_tile` served from the cache."""
+        with self._cache_lock:
+            total = self._cache_hits + self._cache_misses
+            return self._cache_hits / total if total else 0.0
+
+    def clear_cache(self) -> None:
+        """Remove all tiles from the tile cache and reset the hit rate."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_bytes_used = 0
+            self._cache_hits = 0
+            self._cache_misses = 0
+
+    def _read_level(self, level: int) -> Optional[np.ndarray]:
+        """Read a whole pyramid level if it is small enough.
+
+        The read covers the whole tile grid plus the overlap on each
+        edge, so that tiles can be sliced from it directly with
+        :func:`_tile_from_level`. It uses the same geometry, padding and
+        interpolation as a per-tile read with :func:`get_tile`.
+
+        Args:
+            level (int): The pyramid level to read.
+
+        Returns:
+            :class:`numpy.ndarray`: The padded level image or None if
+                the level is too large or is a sub-tile level.
+
+        """
+        if level < self.sub_tile_level_count:
+            return None
+        grid_width, grid_height = self.tile_grid_size(level)
+        width = grid_width * self.tile_size + 2 * self.overlap
+        height = grid_height * self.tile_size + 2 * self.overlap
+        if width * height * 3 >= self.level_read_threshold_bytes:
+            return None
+        scale = self.level_downsample(level)
+        return self.wsi.read_rect(
+            (-self.overlap * scale, -self.overlap * scale),
+            size=(width, height),
+            resolution=1 / scale,
+            units="baseline",
+            pad_mode="constant",
+            interpolation=self._interp_for_level(level),
+        )
+
+    def _tile_from_level(self, level_image: np.ndarray, x: int, y: int) -> np.ndarray:
+        """Slice a tile from a padded level image from :func:`_read_level`."""
+        left = x * self.tile_size
+        top = y * self.tile_size
+        size = self.output_tile_size
+        return level_image[top : top + size, left : left + size]
+
+    def _iter_tile_indexes(
+        self,
+    ) -> Iterator[Tuple[int, int, int, Optional[np.ndarray]]]:
+        """Generate the index of every tile along with its level image.
+
+        The level image is the whole level from :func:`_read_level` if
+        the level is small enough to be read at once, otherwise None.
+
+        Yields:
+            tuple: The level, x, y, and level image for each tile.
+
+        """
+        for level in range(self.level_count):
+            level_image = self._read_level(level)
+            for x, y in self._morton_order(*self.tile_grid_size(level)):
+                yield level, x, y, level_image
+
+    def _render_tile(
+        self, level: int, x: int, y: int, level_image: Optional[np.ndarray] = None
+    ) -> Tuple[str, bytes]:
+        """Get a tile and encode it as JPEG in memory.
+
+        This is the unit of work for each thread in :func:`dump`. Only
+        the serialised bytes are returned so that writing to a
+        (non-thread-safe) archive can happen on the calling thread.
+
+        Args:
+            level (int):
+                The pyramid level of the tile.
+            x (int):
+                The tile index in the x direction.
+            y (int):
+                The tile index in the y direction.
+            level_image (:class:`numpy.ndarray`):
+                The padded level image from :func:`_read_level` to
+                slice the tile from. If None, the tile is read with
+                :func:`get_tile`.
+
+        Returns:
+            tuple: The tile path and the JPEG encoded tile bytes.
+
+        """
+        tile_path, tile = self._read_dump_tile(level, x, y, level_image)
+        return tile_path, _encode_jpeg(tile)
+
+    def _read_dump_tile(
+        self, level: int, x: int, y: int, level_image: Optional[np.ndarray] = None
+    ) -> Tuple[str, np.ndarray]:
+        """Get a tile and its path without encoding it.
+
+        See :func:`_render_tile` for a description of the arguments.
+
+        Returns:
+            tuple: The tile path and the tile pixel data.
+
+        """
+        if level_image is None:
+            tile = self._read_uncached_tile(level, x, y)
+        else:
+            tile = self._tile_from_level(level_image, x, y)
+        return self.tile_path(level, x, y), tile
+
+    def _render_tiles(self, num_encode_workers: int = 0) -> Iterator[Tuple[str, bytes]]:
+        """Read and JPEG encode every tile in the pyramid.
+
+        Tiles are read in a pool of threads. Only a bounded number of
+        tiles are in flight at once so that memory use does not grow
+        with the size of the pyramid. Encoding is done in the same
+        threads unless `num_encode_workers` is greater than 0, in
+        which case tiles are encoded in a pool of processes.
+
+        Args:
+            num_encode_workers (int): Number of processes to use for
+                JPEG encoding. Defaults to 0 (encode in the threads).
+
+        Yields:
+            tuple: The tile path and the JPEG encoded tile bytes, in
+                the order that tiles are completed.
+
+        """
+        max_workers = min(32, _available_cpu_count())
+        max_pending = 2 * max_workers
+        # Fill the per-level caches so that worker threads only read them
+        for level in range(self.level_count):
+            self.tile_grid_size(level)
+            self._interp_for_level(level)
+        with ExitStack() as stack:
+            encoder = None
+            if num_encode_workers > 0:
+                encoder = stack.enter_context(ProcessPoolExecutor(num_encode_workers))
+                # Start the processes before any reader threads exist so
+                # that they are never forked while threads hold locks.
+                encoder.submit(int).result()
+            stack.enter_context(self._pooled_readers())
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers))
+            if encoder is None:
+                yield from _bounded_imap_unordered(
+                    executor, self._render_tile, self._iter_tile_indexes(), max_pending
+                )
+                return
+            tiles = _bounded_imap_unordered(
+                executor, self._read_dump_tile, self._iter_tile_indexes(), max_pending
+            )
+            # Tiles are sent to the processes in chunks to amortise the cost
+            # of pickling. Batches bound the number of tiles held in memory.
+            chunksize = 8
+            batch_size = 2 * num_encode_workers * chunksize
+            while True:
+                batch = list(itertools.islice(tiles, batch_size))
+                if not batch:
+                    return
+                tile_paths, arrays = zip(*batch)
+                encoded = encoder.map(_encode_jpeg, arrays, chunksize=chunksize)
+                yield from zip(tile_paths, encoded)
+
+    def tile_path(self, level: int, x: int, y: int) -> str:
         """Generate the path for a specified tile.
 
         Args:
@@ -252,13 +985,18 @@ class TilePyramidGenerator:
                 The tile index in the y direction.
 
         Returns:
-            Path: A pathlib path object with two parts.
+            str: A relative path with two parts separated by a forward
+                slash.
 
         """
         raise NotImplementedError
 
     def dump(  # noqa: CCR001
-        self, path: Union[str, Path], container=None, compression=None
+        self,
+        path: Union[str, Path],
+        container=None,
+        compression=None,
+        num_encode_workers: int = 0,
     ):
         """Write all tiles to disk.
 
@@ -268,8 +1006,16 @@ class TilePyramidGenerator:
                 saves to a directory. Possible values are "zip", "tar".
             compression (str): Compression method. Defaults to None.
                 Possible values are None, "deflate", "gzip",
-                "bz2", "lzma". Note that tar does not support deflate
-                and zip does not support gzip.
+                "bz2", "lzma", "zstd". Note that tar does not support
+                deflate and zip does not support gzip. zstd (level 3)
+                requires Python 3.14 for zip, and Python 3.14 or the
+                zstandard package for tar.
+            num_encode_workers (int): Number of processes to use for
+                JPEG encoding. Defaults to 0 which encodes tiles in
+                the threads that read them. Where processes are started
+                with spawn (the default on macOS and Windows), a script
+                using this must guard its entry point with
+                `if __name__ == "__main__":`.
 
         Examples:
             >>> from tiatoolbox.tools.pyramid import TilePyramidGenerator
@@ -289,17 +1035,24 @@ class TilePyramidGenerator:
         path = Path(path)
         if container not in [None, "zip", "tar"]:
             raise ValueError("Unsupported container")
+        zstd_level = 3
+        zstd_stream = None
 
         if container is None:
             path.mkdir(parents=False)
             if compression is not None:
                 raise ValueError("Unsupported compression for container None")
 
-            def save_tile(tile_path: Path, tile: Image.Image) -> None:
+            created_dirs = set()
+
+            def save_tile(tile_path: str, data: bytes) -> None:
                 """Write the tile to the output directory."""
                 full_path = path / tile_path
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                tile.save(full_path)
+                # Only create each tile directory once, not once per tile
+                if full_path.parent not in created_dirs:
+                    full_path.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(full_path.parent)
+                full_path.write_bytes(data)
 
         elif container == "zip":
             compression2enum = {
@@ -308,24 +1061,22 @@ class TilePyramidGenerator:
                 "bz2": zipfile.ZIP_BZIP2,
                 "lzma": zipfile.ZIP_LZMA,
             }
+            if hasattr(zipfile, "ZIP_ZSTANDARD"):  # Python >= 3.14
+                compression2enum["zstd"] = zipfile.ZIP_ZSTANDARD
             if compression not in compression2enum:
                 raise ValueError("Unsupported compression for zip")
 
             archive = zipfile.ZipFile(
-                path, mode="w", compression=compression2enum[compression]
+                path,
+                mode="w",
+                compression=compression2enum[compression],
+                compresslevel=zstd_level if compression == "zstd" else None,
             )
 
-            def save_tile(tile_path: Path, tile: Image.Image) -> None:
-                """Write the tile to the output tar."""
-                bio = BytesIO()
-                tile.save(bio, format="jpeg")
-                bio.seek(0)
-                data = bio.read()
-                archive.writestr(
-                    str(tile_path),
-                    data,
-                    compress_type=compression2enum[compression],
-                )
+            def save_tile(tile_path: str, data: bytes) -> None:
+                """Write the tile to the output zip."""
+                # Encoded bytes go straight in, using the archive's compression
+                archive.writestr(tile_path, data)
 
         else:  # container == "tar":
             compression2mode = {
@@ -334,39 +1085,101 @@ class TilePyramidGenerator:
                 "bz2": "w:bz2",
                 "lzma": "w:xz",
             }
+            if hasattr(tarfile.TarFile, "zstopen"):  # Python >= 3.14
+                compression2mode["zstd"] = "w:zst"
+            elif zstandard is not None:
+                compression2mode["zstd"] = "w|"
             if compression not in compression2mode:
                 raise ValueError("Unsupported compression for tar")
 
-            archive = tarfile.TarFile.open(path, mode=compression2mode[compression])
+            mode = compression2mode[compression]
+            if compression == "zstd" and mode == "w|":
+                # Stream the uncompressed tar through a zstandard compressor
+                compressor = zstandard.ZstdCompressor(level=zstd_level)
+                zstd_stream = compressor.stream_writer(path.open("wb"))
+                archive = tarfile.TarFile.open(fileobj=zstd_stream, mode=mode)
+            elif compression == "zstd":
+                archive = tarfile.TarFile.open(path, mode=mode, level=zstd_level)
+            else:
+                archive = tarfile.TarFile.open(path, mode=mode)
 
-            def save_tile(tile_path: Path, tile: Image.Image) -> None:
-                """Write the tile to the output zip."""
-                bio = BytesIO()
-                tile.save(bio, format="jpeg")
-                bio.seek(0)
-                tar_info = tarfile.TarInfo(name=str(tile_path))
-                tar_info.mtime = time.time()
-                tar_info.size = bio.tell()
-                archive.addfile(tarinfo=tar_info, fileobj=bio)
+            mtime = time.time()
 
-        for level in range(self.level_count):
-            for x, y in np.ndindex(self.tile_grid_size(level)):
-                tile = self.get_tile(level=level, x=x, y=y)
-                tile_path = self.tile_path(level, x, y)
-                save_tile(tile_path, tile)
+            def save_tile(tile_path: str, data: bytes) -> None:
+                """Write the tile to the output tar."""
+                tar_info = tarfile.TarInfo(name=tile_path)
+                tar_info.mtime = mtime
+                tar_info.size = len(data)
+                # BytesIO over immutable bytes shares the buffer (no copy)
+                archive.addfile(tarinfo=tar_info, fileobj=BytesIO(data))
+
+        for tile_path, data in self._render_tiles(num_encode_workers):
+            save_tile(tile_path, data)
 
         if container is not None:
             archive.close()
+        if zstd_stream is not None:
+            zstd_stream.close()
+
+    @property
+    def _level_tile_counts(self) -> np.ndarray:
+        """Number of tiles in each level of the pyramid.
+
+        This is computed for all levels at once and cached on the first
+        call.
+
+        """
+        if self._m_level_tile_counts is not None:
+            return self._m_level_tile_counts
+        levels = np.arange(self.level_count, dtype=np.int64)
+        downsamples = 2 ** (self.level_count - 1 - levels)
+        # Integer ceil division of the slide size by the baseline size of
+        # a tile at each level, equivalent to tile_grid_size.
+        tile_footprints = downsamples[:, None] * self.tile_size
+        grid_sizes = -(-self._slide_dimensions[None, :] // tile_footprints)
+        self._m_level_tile_counts = grid_sizes.prod(axis=1)
+        return self._m_level_tile_counts
+
+    @property
+    def _tile_count_prefix(self) -> np.ndarray:
+        """Total number of tiles in all levels before each level.
+
+        Element `n` is the number of tiles in levels `0` to `n - 1`
+        and the final element is the total number of tiles. This is
+        cached on the first call.
+
+        """
+        if self._m_tile_count_prefix is None:
+            self._m_tile_count_prefix = np.concatenate(
+                ([0], np.cumsum(self._level_tile_counts))
+            )
+        return self._m_tile_count_prefix
 
     def __len__(self) -> int:
-        return sum(
-            np.prod(self.tile_grid_size(level)) for level in range(self.level_count)
-        )
+        return int(self._tile_count_prefix[-1])
 
     def __iter__(self) -> Iterable:
-        for level in range(self.level_count):
-            for x, y in np.ndindex(self.tile_grid_size(level)):
-                yield self.get_tile(level=level, x=x, y=y)
+        # Read the next few tiles in threads while the current one is used
+        ahead = 4
+        with self._pooled_readers(), ThreadPoolExecutor(ahead) as executor:
+            yield from _prefetch(
+                executor, self._iter_tile, self._iter_tile_indexes(), ahead
+            )
+
+    def _iter_tile(
+        self, level: int, x: int, y: int, level_image: Optional[np.ndarray]
+    ) -> Image:
+        """Get a tile for :func:`__iter__`.
+
+        See :func:`_render_tile` for a description of the arguments.
+
+        Returns:
+            :class:`PIL.Image`: The tile.
+
+        """
+        if level_image is None:
+            return Image.fromarray(self._read_uncached_tile(level, x, y))
+        return Image.fromarray(self._tile_from_level(level_image, x, y))
 
 
 class ZoomifyGenerator(TilePyramidGenerator):
@@ -395,10 +1208,18 @@ class ZoomifyGenerator(TilePyramidGenerator):
         tile_overlap (int):
             The number of extra pixel to add to each
             edge of the tile. Default is 0.
+        cache_bytes (int):
+            The maximum number of bytes of tile pixel data to keep
+            in an in-memory least recently used cache of tiles.
+            Default is 64 MiB. Setting to 0 disables the cache.
+        level_read_threshold_bytes (int):
+            Levels with fewer RGB bytes than this are read from the
+            WSI in one go when iterating or dumping tiles, instead of
+            once per tile. Default is 256 MiB. Setting to 0 always
+            reads per tile.
 
     """
 
-    @lru_cache(maxsize=None)
     def tile_group(self, level: int, x: int, y: int):
         """Find the tile group for a tile index.
 
@@ -418,16 +1239,16 @@ class ZoomifyGenerator(TilePyramidGenerator):
             int: The tile group for the specified tile.
 
         """
-        grid_size = np.array(self.tile_grid_size(level))
-        if any(grid_size <= [x, y]):
+        grid_width, grid_height = self.tile_grid_size(level)
+        if not (0 <= x < grid_width and 0 <= y < grid_height):
             raise IndexError
-        cumsum = sum(np.prod(self.tile_grid_size(n)) for n in range(level))
-        index_in_level = np.ravel_multi_index((y, x), self.tile_grid_size(level)[::-1])
+        cumsum = int(self._tile_count_prefix[level])
+        # Index of the tile in row-major (YX) order within the level
+        index_in_level = y * grid_width + x
         tile_index = cumsum + index_in_level
-        return tile_index // 256  # the tile group
+        return tile_index // 256
 
-    @lru_cache(maxsize=None)
-    def tile_path(self, level: int, x: int, y: int) -> Path:
+    def tile_path(self, level: int, x: int, y: int) -> str:
         """Generate the Zoomify path for a specified tile.
 
         Args:
@@ -437,9 +1258,10 @@ class ZoomifyGenerator(TilePyramidGenerator):
             y (int): The tile index in the y direction.
 
         Returns:
-            Path: A pathlib path object with two parts.
+            str: A relative path with two parts separated by a forward
+                slash.
 
         """
         g = self.tile_group(level, x, y)
         z = level
-        return Path(f"TileGroup{g}") / f"{z}-{x}-{y}.jpg"
+        return f"TileGroup{g}/{z}-{x}-{y}.jpg"
@@ -62,6 +62,7 @@ class TileServer(Flask):
         self.tia_pyramids = {
             key: ZoomifyGenerator(reader) for key, reader in self.tia_layers.items()
         }
+        self._m_layers_json = None
         self.route(
             "/layer/<layer>/zoomify/TileGroup<int:tile_group>/"
             "<int:z>-<int:x>-<int:y>.jpg"
@@ -110,15 +111,30 @@ class TileServer(Flask):
             Response: The index page.
 
         """
-        layers = [
-            {
-                "name": name,
-                "url": f"/layer/{name}/zoomify/{{TileGroup}}/{{z}}-{{x}}-{{y}}.jpg",
-                "size": [int(x) for x in reader.info.slide_dimensions],
-                "mpp": float(np.mean(reader.info.mpp)),
-            }
-            for name, reader in self.tia_layers.items()
-        ]
         return render_template(
-            "index.html", title=self.tia_title, layers=json.dumps(layers)
+            "index.html", title=self.tia_title, layers=self._layers_json
         )
+
+    @property
+    def _layers_json(self) -> str:
+        """The JSON layer metadata for the index page.
+
+        The layers do not change after the app is created, so this is
+        serialised on the first request and reused afterwards.
+
+        """
+        if self._m_layers_json is None:
+            layers = []
+            for name, reader in self.tia_layers.items():
+                info = reader.info
+                url = f"/layer/{name}/zoomify/{{TileGroup}}/{{z}}-{{x}}-{{y}}.jpg"
+                layers.append(
+                    {
+                        "name": name,
+                        "url": url,
+                        "size": [int(x) for x in info.slide_dimensions],
+                        "mpp": float(np.mean(info.mpp)),
+                    }
+                )
+            self._m_layers_json = json.dumps(layers)
+        return self._m_layers_json
@@ -2047,6 +2047,7 @@ class TIFFWSIReader(WSIReader):
         cache_size=2 ** 28,
     ) -> None:
         super().__init__(input_img=input_img, mpp=mpp, power=power)
+        self.cache_size = cache_size
         self.tiff = tifffile.TiffFile(self.input_path)
         self._axes = self.tiff.pages[0].axes
         if not any([self.tiff.is_svs, self.tiff.is_ome]):